@@ -2,27 +2,282 @@ import sys
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton,
     QVBoxLayout, QHBoxLayout, QMessageBox, QComboBox, QGroupBox,
-    QGridLayout, QDialog
+    QFormLayout, QDialog
 )
-from PySide6.QtCore import (Qt, QTimer)
-from PySide6.QtGui import QFont
-import pyvisa
-import csv
+from PySide6.QtCore import (Qt, QTimer, QThread, QThreadPool, QRunnable,
+                            QObject, QMutex, Signal, Slot)
+from PySide6.QtGui import QFont, QIntValidator, QDoubleValidator
+import io
+import json
 import os
+import time
 from datetime import datetime
-import pyqtgraph as pg
+import numpy as np
+
+
+# VISA enumeration can take seconds; remember the last result so startup
+# can fill the device list instantly while a fresh scan runs in the background
+_DEVICE_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "keithley2230g", "devices.json")
+
+# Message templates built once at import; the apply path fills values in
+# with str.format instead of assembling a new literal each call. The
+# leading ':' resets the SCPI command tree when chained after ';'
+_SCPI_NSEL = "INST:NSEL {}"
+_SCPI_VLIM = ":SOUR:VOLT:LIM {};:SOUR:VOLT:LIM:STAT ON"
+_SCPI_VOLT = ":SOUR:VOLT {}"
+_SCPI_CURR = ":SOUR:CURR {}"
+# Indexed by the desired output state (False -> OFF, True -> ON)
+_OUTP_CMDS = ("OUTP OFF", "OUTP ON")
+_STATUS_TMPL = "Set: CH{0} V={2}V I={3}A (Limit: {1}V)"
+
+# Shared by every window instance; built lazily because QFont needs a
+# QApplication to exist first
+_TITLE_FONT = None
+
+
+def _title_font():
+    global _TITLE_FONT
+    if _TITLE_FONT is None:
+        _TITLE_FONT = QFont()
+        _TITLE_FONT.setPointSize(12)
+        _TITLE_FONT.setBold(True)
+    return _TITLE_FONT
+
+
+class _ScanSignals(QObject):
+    finished = Signal(list)
+
+
+class DeviceScanner(QRunnable):
+    """Refreshes the VISA resource list off the GUI thread.
+
+    Given rm=None the scanner also imports pyvisa and builds the resource
+    manager here, so the backend DLL load never stalls the GUI thread.
+    """
+
+    def __init__(self, rm):
+        super().__init__()
+        self.rm = rm
+        self.signals = _ScanSignals()
+
+    def run(self):
+        try:
+            if self.rm is None:
+                import pyvisa
+                self.rm = pyvisa.ResourceManager()
+            resources = list(self.rm.list_resources())
+        except Exception:
+            resources = []
+        self.signals.finished.emit(resources)
+
+
+class VoltageSampler(QObject):
+    """Owns the VISA instrument off the GUI thread.
+
+    All blocking bus traffic — connecting, applying settings, toggling
+    the output and the 1 Hz voltage poll — runs here so the Qt event
+    loop never waits on VISA; results come back via signals.
+    """
+    # Chain SCPI commands with ';' into one message; set False to fall back
+    # to per-command writes if a firmware revision rejects compound messages
+    _USE_COMPOUND_SCPI = True
+
+    sampleReady = Signal(float)
+    connected = Signal(str, bool)               # *IDN? response, output on?
+    applied = Signal(int, float, float, float)  # channel, vlim, v, i
+    toggled = Signal(bool)                      # new output state
+    failed = Signal(str, str)                   # dialog title, message
+
+    def __init__(self):
+        super().__init__()
+        self.rm = None  # handed over by the GUI before the first connect
+        self.inst = None
+        self.mutex = QMutex()
+        self._timer = None
+        # Last values written per field; lets do_apply skip commands whose
+        # value hasn't changed since the previous apply
+        self._last = {"ch": None, "vlim": None, "v": None, "i": None}
+
+    @Slot()
+    def start(self):
+        """Create the poll timer once the worker thread is running.
+
+        The timer stays stopped until a device is connected, so an idle
+        window causes no wakeups at all.
+        """
+        self._timer = QTimer(self)
+        # 1 Hz logging doesn't need ms accuracy; a coarse timer lets the
+        # OS coalesce wakeups with other system events
+        self._timer.setTimerType(Qt.CoarseTimer)
+        self._timer.timeout.connect(self.poll)
+
+    @Slot()
+    def start_polling(self):
+        self._timer.start(1000)  # Poll every 1 second
+
+    @Slot()
+    def stop_polling(self):
+        self._timer.stop()
+
+    @Slot()
+    def poll(self):
+        """Read the voltage and emit it; skipped while disconnected"""
+        self.mutex.lock()
+        try:
+            if self.inst is None:
+                return
+            voltage = float(self.inst.query("MEAS:VOLT?").strip())
+        except Exception:
+            return
+        finally:
+            self.mutex.unlock()
+        self.sampleReady.emit(voltage)
+
+    @Slot(str)
+    def do_connect(self, address):
+        """Open the resource and identify it; polling starts on success"""
+        try:
+            inst = self.rm.open_resource(address)
+            # Tune the session up front: a fast fail timeout, a chunk size
+            # large enough that replies arrive in one low-level read, and
+            # explicit newline termination so reads stop at the terminator
+            # instead of waiting for the timeout
+            inst.timeout = 3000
+            inst.chunk_size = 1024 * 1024
+            inst.write_termination = "\n"
+            inst.read_termination = "\n"
+            inst.send_end = True
+            idn = inst.query("*IDN?").strip()
+            # Read the real output state instead of assuming OFF; another
+            # client or the front panel may have switched it already
+            output_on = inst.query("OUTP?").strip() in ("1", "ON")
+        except Exception as e:
+            self.failed.emit("Connection Error", str(e))
+            return
+        self.mutex.lock()
+        self.inst = inst
+        self.mutex.unlock()
+        self._last = {"ch": None, "vlim": None, "v": None, "i": None}
+        self.start_polling()
+        self.connected.emit(idn, output_on)
+
+    @Slot(int, float, float, float)
+    def do_apply(self, channel, voltage_limit, voltage, current):
+        """Push already-validated settings to the instrument"""
+        # Only send commands whose value changed since the last apply; a
+        # channel change invalidates the per-channel source settings, so
+        # everything is resent after INST:NSEL
+        dirty_ch = channel != self._last["ch"]
+        cmds = []
+        if dirty_ch:
+            cmds.append(_SCPI_NSEL.format(channel))
+        if dirty_ch or voltage_limit != self._last["vlim"]:
+            cmds.append(_SCPI_VLIM.format(voltage_limit))
+        if dirty_ch or voltage != self._last["v"]:
+            cmds.append(_SCPI_VOLT.format(voltage))
+        if dirty_ch or current != self._last["i"]:
+            cmds.append(_SCPI_CURR.format(current))
+
+        self.mutex.lock()
+        try:
+            if self.inst is None:
+                return
+            if cmds:
+                if self._USE_COMPOUND_SCPI:
+                    # One bus round-trip for however many commands survive
+                    self.inst.write(";".join(cmds))
+                else:
+                    for cmd in ";".join(cmds).split(";"):
+                        self.inst.write(cmd.lstrip(":"))
+        except Exception as e:
+            self.failed.emit("Error", str(e))
+            return
+        finally:
+            self.mutex.unlock()
+        self._last = {"ch": channel, "vlim": voltage_limit,
+                      "v": voltage, "i": current}
+        self.applied.emit(channel, voltage_limit, voltage, current)
+
+    @Slot(bool)
+    def do_toggle(self, state):
+        """Switch the output relay on or off"""
+        self.mutex.lock()
+        try:
+            if self.inst is None:
+                return
+            self.inst.write(_OUTP_CMDS[state])
+        except Exception as e:
+            self.failed.emit("Error", str(e))
+            return
+        finally:
+            self.mutex.unlock()
+        self.toggled.emit(state)
+
+    @Slot()
+    def do_disconnect(self):
+        """Stop polling and release the instrument"""
+        self.stop_polling()
+        self.mutex.lock()
+        inst, self.inst = self.inst, None
+        self.mutex.unlock()
+        self._last = {"ch": None, "vlim": None, "v": None, "i": None}
+        if inst is not None:
+            try:
+                inst.close()
+            except Exception:
+                pass
 
 
 class PowerSupplyGUI(QWidget):
+    # Queued signals carry requests to the VISA worker thread, so the
+    # button handlers return immediately and bus latency never blocks paints
+    # Parsed by Qt once per setStyleSheet call; keeping the two variants as
+    # constants means toggling swaps strings instead of rebuilding them
+    _STYLE_ON = "background-color: #51cf66; color: white; font-weight: bold; min-height: 40px; padding: 12px;"
+    _STYLE_OFF = "background-color: #ff6b6b; color: white; font-weight: bold; min-height: 40px; padding: 12px;"
+
+    connectRequested = Signal(str)
+    disconnectRequested = Signal()
+    applyRequested = Signal(int, float, float, float)
+    toggleRequested = Signal(bool)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Keithley 2230G Controller")
         self.setFixedSize(480, 560)
 
-        # Initialize VISA
-        self.rm = pyvisa.ResourceManager()
-        self.inst = None
+        # VISA resource manager is created lazily on first use
+        self._rm = None
+        self._connected = False
         self.output_state = False
+        # True while a settings batch is in flight on the worker; rapid
+        # clicks are dropped instead of queueing duplicate batches
+        self._busy = False
+        self._psu_log_fh = None
+        # Decide once whether psu_log.csv needs its header; no stat per Apply
+        self._psu_header_written = os.path.isfile("psu_log.csv")
+
+        # Inputs are parsed once per edit (see _cache_value) rather than
+        # re-parsed on every Apply click; keys mirror the SCPI parameters
+        self._vals = {"channel": 1, "vlim": 15.0, "v": 5.0, "i": 1.0}
+
+        # Buffer samples and write them in chunks to amortize I/O cost
+        self._log_buffer = []
+        self._LOG_FLUSH_EVERY = 30
+        self._ts_cache = (0, "")
+
+        # Samples kept in memory so the graph never has to re-parse the CSV
+        # log; preallocated typed arrays grown by doubling, so pyqtgraph
+        # gets zero-copy slices instead of lists of boxed floats
+        self._ts_arr = np.empty(1024, np.float64)
+        self._v_arr = np.empty(1024, np.float32)
+        self._n = 0
+
+        # Live graph state; updates are driven by sampleReady and skipped
+        # while the dialog is closed
+        self._graph_dialog = None
+        self._graph_curve = None
 
         # Simple styling
         self.setStyleSheet("""
@@ -30,14 +285,56 @@ class PowerSupplyGUI(QWidget):
             QPushButton { padding: 12px; min-height: 30px; }
         """)
 
+        # One reusable dialog per severity; repeated errors just retitle
+        # and retext it instead of rebuilding a widget tree each time
+        self._warn = QMessageBox(self)
+        self._warn.setIcon(QMessageBox.Warning)
+        self._err = QMessageBox(self)
+        self._err.setIcon(QMessageBox.Critical)
+
         self.init_ui()
-        self.load_devices()
+        # Defer the first scan one event-loop turn so the window paints
+        # before any VISA work starts
+        QTimer.singleShot(0, self.load_devices)
         self.log_file = "temp_voltage_log.csv"
         self.create_log_file()
 
-        self.log_timer = QTimer(self)
-        self.log_timer.timeout.connect(self.log_voltage)
-        self.log_timer.start(1000)  # Log every 1 second
+        self._io_thread = QThread(self)
+        self._sampler = VoltageSampler()
+        self._sampler.moveToThread(self._io_thread)
+        self._io_thread.started.connect(self._sampler.start)
+        self._sampler.sampleReady.connect(self.log_voltage)
+        self._sampler.connected.connect(self._on_connected)
+        self._sampler.applied.connect(self._on_applied)
+        self._sampler.toggled.connect(self._on_toggled)
+        self._sampler.failed.connect(self._on_visa_failed)
+        self.connectRequested.connect(self._sampler.do_connect)
+        self.disconnectRequested.connect(self._sampler.do_disconnect)
+        self.applyRequested.connect(self._sampler.do_apply)
+        self.toggleRequested.connect(self._sampler.do_toggle)
+        self._io_thread.start()
+
+    @property
+    def rm(self):
+        """VISA resource manager, constructed on first access.
+
+        Normally the device scan has already built one in its worker; this
+        only pays for the import/construction if that hasn't happened yet.
+        """
+        if self._rm is None:
+            import pyvisa
+            self._rm = pyvisa.ResourceManager()
+        return self._rm
+
+    def _show_warning(self, title, text):
+        self._warn.setWindowTitle(title)
+        self._warn.setText(text)
+        self._warn.exec()
+
+    def _show_error(self, title, text):
+        self._err.setWindowTitle(title)
+        self._err.setText(text)
+        self._err.exec()
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -46,10 +343,9 @@ class PowerSupplyGUI(QWidget):
         # Title
         title = QLabel("Keithley 2230G Controller")
         title.setAlignment(Qt.AlignCenter)
-        font = QFont()
-        font.setPointSize(12)
-        font.setBold(True)
-        title.setFont(font)
+        title.setFont(_title_font())
+        # Static text; let mouse events skip it instead of hit-testing
+        title.setAttribute(Qt.WA_TransparentForMouseEvents)
         layout.addWidget(title)
 
         # Connection section
@@ -66,37 +362,55 @@ class PowerSupplyGUI(QWidget):
         conn_layout.addLayout(device_layout)
 
         self.status_label = QLabel("Not connected")
+        self.status_label.setAttribute(Qt.WA_TransparentForMouseEvents)
         conn_layout.addWidget(self.status_label)
         conn_group.setLayout(conn_layout)
         layout.addWidget(conn_group)
 
         # Control section
         control_group = QGroupBox("Control")
-        control_layout = QGridLayout()
+        # Form layout is specialized for label/field rows and recomputes
+        # fewer size hints on resize than a general grid
+        control_layout = QFormLayout()
 
-        control_layout.addWidget(QLabel("Channel:"), 0, 0)
         self.channel_input = QLineEdit("1")
         self.channel_input.setFixedWidth(50)
-        control_layout.addWidget(self.channel_input, 0, 1)
+        control_layout.addRow("Channel:", self.channel_input)
 
-        control_layout.addWidget(QLabel("Voltage Limit (V):"), 1, 0)
         self.voltage_limit_input = QLineEdit("15.0")
-        control_layout.addWidget(self.voltage_limit_input, 1, 1)
+        control_layout.addRow("Voltage Limit (V):", self.voltage_limit_input)
 
-        control_layout.addWidget(QLabel("Voltage Set (V):"), 2, 0)
         self.voltage_input = QLineEdit("5.0")
-        control_layout.addWidget(self.voltage_input, 2, 1)
+        control_layout.addRow("Voltage Set (V):", self.voltage_input)
 
-        control_layout.addWidget(QLabel("Current (A):"), 3, 0)
         self.current_input = QLineEdit("1.0")
-        control_layout.addWidget(self.current_input, 3, 1)
+        control_layout.addRow("Current (A):", self.current_input)
+
+        # Validators keep non-numeric text out of the handlers entirely
+        self.channel_input.setValidator(QIntValidator(1, 3, self))
+        double_validator = QDoubleValidator(0.0, 1000.0, 3, self)
+        double_validator.setNotation(QDoubleValidator.StandardNotation)
+        self.voltage_limit_input.setValidator(double_validator)
+        self.voltage_input.setValidator(double_validator)
+        self.current_input.setValidator(double_validator)
+
+        # Parse each field when it changes, not on every Apply
+        for key, edit, parser in (
+                ("channel", self.channel_input, int),
+                ("vlim", self.voltage_limit_input, float),
+                ("v", self.voltage_input, float),
+                ("i", self.current_input, float)):
+            edit.textChanged.connect(
+                lambda text, k=key, p=parser: self._cache_value(k, p, text))
 
         # Buttons with proper spacing and size
         button_layout = QVBoxLayout()
         button_layout.setSpacing(10)
 
         self.set_btn = QPushButton("Apply Settings")
-        self.set_btn.clicked.connect(self.set_values)
+        # Queued so a click burst is processed one event-loop turn at a
+        # time, letting the in-flight guard in set_values debounce it
+        self.set_btn.clicked.connect(self.set_values, Qt.QueuedConnection)
         self.set_btn.setEnabled(False)
         self.set_btn.setMinimumHeight(40)
         button_layout.addWidget(self.set_btn)
@@ -105,8 +419,7 @@ class PowerSupplyGUI(QWidget):
         self.output_btn.clicked.connect(self.toggle_output)
         self.output_btn.setEnabled(False)
         self.output_btn.setMinimumHeight(40)
-        self.output_btn.setStyleSheet(
-            "background-color: #ff6b6b; color: white; font-weight: bold; min-height: 40px; padding: 12px;")
+        self.output_btn.setStyleSheet(self._STYLE_OFF)
         button_layout.addWidget(self.output_btn)
 
         self.graph_btn = QPushButton("Show Graph")
@@ -114,137 +427,186 @@ class PowerSupplyGUI(QWidget):
         self.graph_btn.setMinimumHeight(40)
         button_layout.addWidget(self.graph_btn)
 
-        control_layout.addLayout(button_layout, 4, 0, 1, 2)
+        control_layout.addRow(button_layout)
         control_group.setLayout(control_layout)
         layout.addWidget(control_group)
 
         self.setLayout(layout)
 
     def load_devices(self):
-        """Load available VISA devices"""
+        """Load available VISA devices, cached list first then a fresh scan"""
+        cached = self._read_device_cache()
+        if cached:
+            self.device_combo.addItems(cached)
+
+        if not self._connected:
+            self.status_label.setText("Refreshing device list...")
+        self._scanner = DeviceScanner(self._rm)
+        self._scanner.signals.finished.connect(self._on_devices_scanned)
+        QThreadPool.globalInstance().start(self._scanner)
+
+    def _read_device_cache(self):
         try:
-            resources = self.rm.list_resources()
+            with open(_DEVICE_CACHE_FILE) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return []
+
+    @Slot(list)
+    def _on_devices_scanned(self, resources):
+        """Replace the combo contents with the fresh scan and cache it"""
+        # Adopt the resource manager the scanner built off-thread
+        if self._rm is None:
+            self._rm = self._scanner.rm
+        self.device_combo.clear()
+        if resources:
             self.device_combo.addItems(resources)
-            if not resources:
-                self.device_combo.addItem("No devices found")
-        except:
+            try:
+                os.makedirs(os.path.dirname(_DEVICE_CACHE_FILE), exist_ok=True)
+                with open(_DEVICE_CACHE_FILE, "w") as file:
+                    json.dump(resources, file)
+            except OSError:
+                pass
+        else:
             self.device_combo.addItem("No devices found")
+        if not self._connected:
+            self.status_label.setText("Not connected")
 
     def connect_device(self):
-        """Connect to selected device"""
+        """Connect to the selected device, or disconnect if already connected"""
+        if self._connected:
+            self.disconnect_device()
+            return
+
         device = self.device_combo.currentText()
         if device == "No devices found":
-            QMessageBox.warning(self, "Error", "No devices available")
+            self._show_warning("Error", "No devices available")
             return
 
-        try:
-            self.inst = self.rm.open_resource(device)
-            idn = self.inst.query("*IDN?").strip()
-
-            self.status_label.setText(f"Connected: {idn.split(',')[0]}")
-            self.connect_btn.setText("Connected")
-            self.connect_btn.setEnabled(False)
-            self.set_btn.setEnabled(True)
-            self.output_btn.setEnabled(True)
+        # The resource manager already exists (the device scan built it);
+        # hand it to the worker, which performs the blocking open there
+        self._sampler.rm = self.rm
+        self.connect_btn.setEnabled(False)
+        self.status_label.setText("Connecting...")
+        self.connectRequested.emit(device)
+
+    @Slot(str, bool)
+    def _on_connected(self, idn, output_on):
+        """Worker opened the instrument; flip the UI into connected state"""
+        self._connected = True
+        self.status_label.setText(f"Connected: {idn.split(',')[0]}")
+        self.connect_btn.setText("Disconnect")
+        self.connect_btn.setEnabled(True)
+        self.set_btn.setEnabled(True)
+        self.output_btn.setEnabled(True)
+        # Sync the output button with the instrument's reported state
+        self._on_toggled(output_on)
+
+    def disconnect_device(self):
+        """Stop polling and release the instrument"""
+        self.disconnectRequested.emit()
+        self._connected = False
+
+        self.status_label.setText("Not connected")
+        self.connect_btn.setText("Connect")
+        self.set_btn.setEnabled(False)
+        self.output_btn.setEnabled(False)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Connection Error", str(e))
+    def _cache_value(self, key, parser, text):
+        """Store a field's parsed value; None while the edit is incomplete"""
+        try:
+            self._vals[key] = parser(text)
+        except ValueError:
+            self._vals[key] = None
 
     def set_values(self):
-        """Set voltage and current"""
-        if not self.inst:
+        """Validate inputs and queue the settings batch on the VISA worker"""
+        if not self._connected or self._busy:
             return
 
-        try:
-            channel = int(self.channel_input.text())
-            voltage_limit = float(self.voltage_limit_input.text())
-            voltage = float(self.voltage_input.text())
-            current = float(self.current_input.text())
+        channel = self._vals["channel"]
+        voltage_limit = self._vals["vlim"]
+        voltage = self._vals["v"]
+        current = self._vals["i"]
 
+        try:
+            if None in (channel, voltage_limit, voltage, current):
+                raise ValueError("All fields must be numbers")
             if not (1 <= channel <= 3):
                 raise ValueError("Channel must be 1, 2, or 3")
             if voltage_limit <= 0 or voltage < 0 or current < 0:
                 raise ValueError("Values must be positive")
             if voltage > voltage_limit:
                 raise ValueError("Set voltage cannot exceed voltage limit")
-
-            self.inst.write(f"INST:NSEL {channel}")
-            self.inst.write(f"SOUR:VOLT:LIM {voltage_limit}")
-            self.inst.write("SOUR:VOLT:LIM:STAT ON")
-            self.inst.write(f"SOUR:VOLT {voltage}")
-            self.inst.write(f"SOUR:CURR {current}")
-
-            self.status_label.setText(f"Set: CH{channel} V={voltage}V I={current}A (Limit: {voltage_limit}V)")
-
-            # Create log directory and file if not exist
-            log_file = "psu_log.csv"
-            file_exists = os.path.isfile(log_file)
-
-            # Log format: timestamp, channel, voltage_limit, voltage, current
-            with open(log_file, mode="a", newline="") as file:
-                writer = csv.writer(file)
-                if not file_exists:
-                    writer.writerow(["Timestamp", "Channel", "VoltageLimit(V)", "Voltage(V)", "Current(A)"])
-                writer.writerow([
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    channel,
-                    voltage_limit,
-                    voltage,
-                    current
-                ])
-
-
         except ValueError as e:
-            QMessageBox.warning(self, "Invalid Input", str(e))
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+            self._show_warning("Invalid Input", str(e))
+            return
+
+        self._busy = True
+        self.set_btn.setEnabled(False)
+        self.applyRequested.emit(channel, voltage_limit, voltage, current)
+
+    @Slot(int, float, float, float)
+    def _on_applied(self, channel, voltage_limit, voltage, current):
+        """Record settings the worker confirmed were written"""
+        self._busy = False
+        self.set_btn.setEnabled(True)
+        self.status_label.setText(_STATUS_TMPL.format(
+            channel, voltage_limit, voltage, current))
+
+        # Log format: timestamp, channel, voltage_limit, voltage, current
+        # Open the settings log once and keep the handle for later writes
+        if self._psu_log_fh is None:
+            self._psu_log_fh = open("psu_log.csv", mode="a", newline="")
+            if not self._psu_header_written:
+                self._psu_log_fh.write("Timestamp,Channel,VoltageLimit(V),Voltage(V),Current(A)\n")
+                self._psu_header_written = True
+
+        # Fixed numeric schema, so format the row directly instead of
+        # going through csv.writer's per-field quoting logic
+        self._psu_log_fh.write(f"{self._now_str()},{channel},{voltage_limit},{voltage},{current}\n")
+        self._psu_log_fh.flush()
 
     def toggle_output(self):
         """Toggle output on/off"""
-        if not self.inst:
+        if not self._connected:
             return
-
-        try:
-            self.output_state = not self.output_state
-            self.inst.write(f"OUTP {'ON' if self.output_state else 'OFF'}")
-
-            if self.output_state:
-                # Output is ON
-                self.output_btn.setText("Output: ON")
-                self.output_btn.setStyleSheet(
-                    "background-color: #51cf66; color: white; font-weight: bold; min-height: 40px; padding: 12px;")
-            else:
-                # Output is OFF
-                self.output_btn.setText("Output: OFF")
-                self.output_btn.setStyleSheet(
-                    "background-color: #ff6b6b; color: white; font-weight: bold; min-height: 40px; padding: 12px;")
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
-
-    def closeEvent(self, event):
-        """Clean up on close"""
-        if self.inst:
-            try:
-                self.inst.close()
-            except:
-                pass
-        event.accept()
-
-
+        self.toggleRequested.emit(not self.output_state)
+
+    @Slot(bool)
+    def _on_toggled(self, state):
+        """Worker confirmed the relay switched; update button state"""
+        self.output_state = state
+        if state:
+            self.output_btn.setText("Output: ON")
+            self.output_btn.setStyleSheet(self._STYLE_ON)
+        else:
+            self.output_btn.setText("Output: OFF")
+            self.output_btn.setStyleSheet(self._STYLE_OFF)
+
+    @Slot(str, str)
+    def _on_visa_failed(self, title, message):
+        """Surface a worker-side VISA error without leaving the UI stuck"""
+        if self._busy:
+            self._busy = False
+            self.set_btn.setEnabled(self._connected)
+        if not self._connected:
+            self.connect_btn.setEnabled(True)
+            self.status_label.setText("Not connected")
+        self._show_error(title, message)
 
     def show_graph(self):
-        if not os.path.exists(self.log_file):
-            QMessageBox.information(self, "No Data", "No log file found.")
+        if self._n == 0:
+            QMessageBox.information(self, "No Data", "No samples recorded yet.")
             return
 
-        timestamps, voltages = [], []
+        # pyqtgraph is heavy (numpy, Qt graphics items, optional OpenGL);
+        # only pay for it if the user actually opens the graph
+        import pyqtgraph as pg
 
-        with open(self.log_file, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                timestamps.append(datetime.strptime(row["Timestamp"], "%Y-%m-%d %H:%M:%S"))
-                voltages.append(float(row["Voltage(V)"]))
+        # Plot straight from the in-memory buffer; zero-copy views
+        x_values = self._ts_arr[:self._n]
+        voltages = self._v_arr[:self._n]
 
         dialog = QDialog(self)
         dialog.setWindowTitle("Voltage vs Time")
@@ -256,58 +618,108 @@ class PowerSupplyGUI(QWidget):
         plot_widget.setBackground("w")
         plot_widget.showGrid(x=True, y=True)
 
+        # Decimate to screen resolution; long runs plot identically with
+        # far fewer points, and pan/zoom only touches the visible range
+        plot_widget.setDownsampling(auto=True, mode='peak')
+        plot_widget.setClipToView(True)
+
         # Use datetime axis
         axis = pg.graphicsItems.DateAxisItem.DateAxisItem(orientation='bottom')
         plot_widget.setAxisItems({'bottom': axis})
 
-        # Convert datetime to UNIX timestamps
-        x_values = [dt.timestamp() for dt in timestamps]
-
-        plot_widget.plot(
+        self._graph_curve = plot_widget.plot(
             x_values,
             voltages,
             pen=pg.mkPen(color='b', width=2),
-            name="Voltage (V)"
+            name="Voltage (V)",
+            autoDownsample=True
         )
 
         plot_widget.setLabel('left', 'Voltage (V)')
         plot_widget.setLabel('bottom', 'Time')
         layout.addWidget(plot_widget)
         dialog.setLayout(layout)
-        dialog.exec()
 
-    def create_log_file(self):
-        with open(self.log_file, mode="w", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(["Timestamp", "Voltage(V)"])
-
-    def log_voltage(self):
-        """Log voltage and timestamp every second if device is connected"""
-        if not self.inst:
-            return
-
-        try:
-            # Ask instrument for voltage reading (depends on Keithley SCPI)
-            voltage = float(self.inst.query("MEAS:VOLT?").strip())
+        # Modeless so new samples keep flowing into the plot while it is open
+        self._graph_dialog = dialog
+        dialog.show()
 
-            with open(self.log_file, mode="a", newline="") as file:
-                writer = csv.writer(file)
-                writer.writerow([
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    voltage
-                ])
-        except Exception as e:
-            # Optional: you could print or log this error
-            pass
+    def create_log_file(self):
+        # Keep the handle open so log_voltage only pays for a write per tick.
+        # A 64 KiB buffer means the OS only sees writes at batch boundaries.
+        raw = open(self.log_file, mode="wb")
+        self._log_buf = io.BufferedWriter(raw, buffer_size=64 * 1024)
+        self._log_fh = io.TextIOWrapper(self._log_buf, encoding="utf-8", newline="")
+        self._log_fh.write("Timestamp,Voltage(V)\n")
+
+    @Slot(float)
+    def log_voltage(self, voltage):
+        """Buffer a voltage sample delivered by the worker thread"""
+        self._log_buffer.append(f"{self._now_str()},{voltage}\n")
+        if len(self._log_buffer) >= self._LOG_FLUSH_EVERY:
+            self._flush_log_buffer()
+
+        if self._n == len(self._ts_arr):
+            self._ts_arr = np.resize(self._ts_arr, 2 * len(self._ts_arr))
+            self._v_arr = np.resize(self._v_arr, 2 * len(self._v_arr))
+        self._ts_arr[self._n] = time.time()
+        self._v_arr[self._n] = voltage
+        self._n += 1
+
+        # Only redraw when someone is actually watching the graph
+        if self._graph_dialog is not None and self._graph_dialog.isVisible():
+            self._graph_curve.setData(self._ts_arr[:self._n], self._v_arr[:self._n])
+
+    def _now_str(self):
+        """Current time as 'YYYY-mm-dd HH:MM:SS', cached per second"""
+        s = int(time.time())
+        if s != self._ts_cache[0]:
+            self._ts_cache = (s, datetime.fromtimestamp(s).strftime("%Y-%m-%d %H:%M:%S"))
+        return self._ts_cache[1]
+
+    def _flush_log_buffer(self):
+        """Move buffered samples into the file's write buffer.
+
+        The 64 KiB buffer decides when bytes actually reach the OS, so in
+        steady state there is roughly one write() syscall per minute. A
+        crash can lose the tail of the temp log, which is acceptable for
+        a file that is deleted on clean exit anyway.
+        """
+        if self._log_buffer:
+            self._log_fh.writelines(self._log_buffer)
+            self._log_buffer.clear()
 
     def closeEvent(self, event):
         """Clean up on close"""
-        self.log_timer.stop()
-        if self.inst:
-            try:
-                self.inst.close()
-            except:
-                pass
+        # Stop the worker thread first; it owns the instrument, so the
+        # handle is only closed once nothing can race on it
+        self._io_thread.quit()
+        self._io_thread.wait()
+
+        # Typed handlers only: a bare except would also swallow
+        # KeyboardInterrupt/SystemExit during shutdown and leave the
+        # process hanging with leaked VISA handles
+        if self._sampler.inst is not None or self._rm is not None:
+            import pyvisa
+            if self._sampler.inst is not None:
+                try:
+                    self._sampler.inst.close()
+                except (pyvisa.errors.VisaIOError, OSError, AttributeError):
+                    pass
+            # Release the backend's handle table as well; check _rm
+            # directly so a session that never touched VISA doesn't build
+            # a resource manager just to close it
+            if self._rm is not None:
+                try:
+                    self._rm.close()
+                except (pyvisa.errors.VisaIOError, OSError, AttributeError):
+                    pass
+
+        self._flush_log_buffer()
+        self._log_fh.flush()
+        self._log_fh.close()
+        if self._psu_log_fh:
+            self._psu_log_fh.close()
 
         if os.path.exists(self.log_file):
             os.remove(self.log_file)
@@ -3,9 +3,9 @@ Styling module for the Power Supply GUI
 Contains all UI styling and theme definitions
 """
 
-def get_main_stylesheet():
-    """Returns the main application stylesheet with conservative colors"""
-    return """
+# Built once at import time; the getter functions return these shared
+# objects directly, so callers must treat them as read-only
+_MAIN_STYLESHEET = """
     /* Main application styling */
     QWidget {
         background-color: #ffffff;
@@ -119,9 +119,7 @@ def get_main_stylesheet():
     }
     """
 
-def get_button_styles():
-    """Returns specific button styling"""
-    return {
+_BUTTON_STYLES = {
         'connect': """
             QPushButton {
                 background-color: #28a745;
@@ -190,9 +188,7 @@ def get_button_styles():
         """
     }
 
-def get_status_styles():
-    """Returns status label styling"""
-    return {
+_STATUS_STYLES = {
         'default': """
             QLabel {
                 background-color: #f8f9fa;
@@ -233,3 +229,15 @@ def get_status_styles():
             }
         """
     }
+
+def get_main_stylesheet():
+    """Returns the main application stylesheet with conservative colors"""
+    return _MAIN_STYLESHEET
+
+def get_button_styles():
+    """Returns specific button styling (shared dict, do not mutate)"""
+    return _BUTTON_STYLES
+
+def get_status_styles():
+    """Returns status label styling (shared dict, do not mutate)"""
+    return _STATUS_STYLES
@@ -3,45 +3,38 @@ Utility functions for the Power Supply GUI
 Contains validation, formatting, and helper functions
 """
 
+# One (parser, min, max, display name) spec per numeric field; every
+# validator is the same parse + range check with no exception-message probing
+_SPECS = {
+    "channel": (int, 1, 3, "Channel"),
+    "voltage": (float, 0.0, 30.0, "Voltage"),
+    "current": (float, 0.0, 5.0, "Current"),
+}
+
+def validate(field, value_str, max_value=None):
+    """Validate a numeric input field against its spec"""
+    parser, lo, hi, name = _SPECS[field]
+    if max_value is not None:
+        hi = max_value
+    try:
+        value = parser(value_str)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number")
+    if not (lo <= value <= hi):
+        raise ValueError(f"{name} must be between {lo} and {hi}")
+    return value
+
 def validate_channel(channel_str):
     """Validate channel input"""
-    try:
-        channel = int(channel_str)
-        if not (1 <= channel <= 3):
-            raise ValueError("Channel must be 1, 2, or 3")
-        return channel
-    except ValueError as e:
-        if "invalid literal" in str(e):
-            raise ValueError("Channel must be a number")
-        raise e
+    return validate("channel", channel_str)
 
 def validate_voltage(voltage_str, max_voltage=30.0):
     """Validate voltage input"""
-    try:
-        voltage = float(voltage_str)
-        if voltage < 0:
-            raise ValueError("Voltage cannot be negative")
-        if voltage > max_voltage:
-            raise ValueError(f"Voltage cannot exceed {max_voltage}V")
-        return voltage
-    except ValueError as e:
-        if "could not convert" in str(e):
-            raise ValueError("Voltage must be a number")
-        raise e
+    return validate("voltage", voltage_str, max_value=max_voltage)
 
 def validate_current(current_str, max_current=5.0):
     """Validate current input"""
-    try:
-        current = float(current_str)
-        if current < 0:
-            raise ValueError("Current cannot be negative")
-        if current > max_current:
-            raise ValueError(f"Current cannot exceed {max_current}A")
-        return current
-    except ValueError as e:
-        if "could not convert" in str(e):
-            raise ValueError("Current must be a number")
-        raise e
+    return validate("current", current_str, max_value=max_current)
 
 def format_device_info(idn_string):
     """Format device identification string for display"""
@@ -1,22 +1,29 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from starlette.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 import pyvisa
 import asyncio
 import json
-from datetime import datetime, timedelta
+import os
+from datetime import datetime
 import uvicorn
 import plotly.graph_objs as go
 import plotly.utils
-from collections import deque
+import numpy as np
 import threading
 import time
 
 
 # Pydantic models for request/response
 class PowerSupplySettings(BaseModel):
+    # Frozen so the validated instance can be cached and re-serialized
+    # without defensive copies
+    model_config = {"frozen": True}
+
     channel: int = Field(..., ge=1, le=3, description="Channel number (1-3)")
     voltage_limit: float = Field(..., ge=0, le=30, description="Voltage limit in V")
     voltage_set: float = Field(..., ge=0, le=30, description="Set voltage in V")
@@ -27,6 +34,14 @@ class OutputControl(BaseModel):
     state: bool = Field(..., description="Output state (True=ON, False=OFF)")
 
 
+class ConnectRequest(BaseModel):
+    device_address: str = Field(..., description="VISA resource address")
+
+
+class ChannelRequest(BaseModel):
+    channel: int = Field(..., ge=1, le=3, description="Channel number (1-3)")
+
+
 class DeviceStatus(BaseModel):
     connected: bool
     device_info: Optional[str] = None
@@ -46,9 +61,14 @@ class VoltageReading(BaseModel):
 app = FastAPI(
     title="Keithley 2230G Remote Controller",
     description="Remote control API for Keithley 2230G Power Supply",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# The HTML page and the JSON plot windows are highly compressible text;
+# gzip shrinks them several-fold for negligible CPU
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Global variables
 rm = None
 instrument = None
@@ -58,24 +78,81 @@ device_status = {
     "last_settings": {},
     "output_state": False,  # Single output state for all channels
     "timestamp": datetime.now().isoformat(),
-    "current_channel": 1
+    "current_channel": 1,
+    "version": 0  # Bumped on every state change; cheap to compare
 }
 
-# Data storage for plotting (store last 100 readings per channel)
-voltage_data = {
-    1: deque(maxlen=100),
-    2: deque(maxlen=100),
-    3: deque(maxlen=100)
-}
-time_data = {
-    1: deque(maxlen=100),
-    2: deque(maxlen=100),
-    3: deque(maxlen=100)
+# Data storage for plotting: one fixed-size SoA ring buffer per channel.
+# 600 slots comfortably covers the 5-minute retention window at 1 Hz.
+_RING_SLOTS = 600
+_RETENTION_NS = 5 * 60 * 1_000_000_000
+
+
+class ChannelRing:
+    """Fixed-size ring buffer of (timestamp_ns, voltage) samples.
+
+    Timestamps are int64 Unix nanoseconds and voltages float64, so a
+    monitor tick is two array writes and reads come back as contiguous
+    numpy slices with no datetime objects involved.
+    """
+
+    def __init__(self, slots=_RING_SLOTS):
+        self.ts = np.zeros(slots, dtype=np.int64)
+        self.volts = np.zeros(slots, dtype=np.float64)
+        self.head = 0   # next write position
+        self.size = 0
+
+    def append(self, t_ns, voltage):
+        self.ts[self.head] = t_ns
+        self.volts[self.head] = voltage
+        self.head = (self.head + 1) % len(self.ts)
+        self.size = min(self.size + 1, len(self.ts))
+
+    def window(self, cutoff_ns):
+        """Samples newer than cutoff_ns as (ts, volts) arrays, oldest first"""
+        if self.size == 0:
+            return self.ts[:0], self.volts[:0]
+        start = (self.head - self.size) % len(self.ts)
+        idx = (start + np.arange(self.size)) % len(self.ts)
+        ts = self.ts[idx]
+        volts = self.volts[idx]
+        keep = np.searchsorted(ts, cutoff_ns)
+        return ts[keep:], volts[keep:]
+
+    def clear(self):
+        self.head = 0
+        self.size = 0
+
+
+rings = {1: ChannelRing(), 2: ChannelRing(), 3: ChannelRing()}
+
+# Background monitoring. The stop event doubles as the 1-second pacing
+# wait, so stopping wakes the task immediately instead of riding out a
+# sleep; it is created on the running loop when monitoring starts.
+monitor_task = None
+_stop_event = None
+
+# SCPI messages that are constant per (channel, state), assembled once so
+# the per-tick paths don't re-run string formatting
+_NSEL = {ch: f"INST:NSEL {ch}" for ch in (1, 2, 3)}
+_ALL_MEAS = "INST:NSEL 1;:MEAS:VOLT?;:INST:NSEL 2;:MEAS:VOLT?;:INST:NSEL 3;:MEAS:VOLT?"
+_ALL_OUTP = {
+    state: ";:".join(
+        f"INST:NSEL {ch};:OUTP {'ON' if state else 'OFF'}" for ch in (1, 2, 3))
+    for state in (True, False)
 }
+_OUTP_PROBE = "INST:NSEL 1;:OUTP?;:INST:NSEL 2;:OUTP?;:INST:NSEL 3;:OUTP?"
+
+# Serializes every VISA transaction between request handlers and the
+# monitor task. This lock — not pyvisa — is the serialization authority:
+# every instrument.write/query must run while holding it, inside a
+# to_thread body so the event loop never blocks on it.
+visa_lock = threading.Lock()
+
 
-# Background monitoring
-monitoring_active = False
-monitoring_thread = None
+async def visa_call(fn, *args):
+    """Run a blocking VISA operation without stalling the event loop"""
+    return await asyncio.to_thread(fn, *args)
 
 
 def initialize_visa():
@@ -90,9 +167,14 @@ def initialize_visa():
 
 
 def update_status():
-    """Update device status timestamp"""
+    """Record a state change: refresh the timestamp and bump the version.
+
+    Called only from mutating handlers; read-only endpoints must leave
+    the status untouched so ETags stay valid between changes.
+    """
     global device_status
     device_status["timestamp"] = datetime.now().isoformat()
+    device_status["version"] += 1
 
 
 def check_initial_output_state():
@@ -101,11 +183,22 @@ def check_initial_output_state():
 
     try:
         # Check output state for all channels
-        output_states = []
-        for channel in [1, 2, 3]:
-            instrument.write(f"INST:NSEL {channel}")
-            output_str = instrument.query("OUTP?")
-            output_states.append(int(output_str.strip()) == 1)
+        with visa_lock:
+            try:
+                # All three channels in one chained round-trip; the reply
+                # is the three OUTP? answers separated by ';'
+                resp = instrument.query(_OUTP_PROBE)
+                parts = [p.strip() for p in resp.split(";")]
+                if len(parts) < 3:
+                    raise ValueError(f"short OUTP? response: {resp!r}")
+                output_states = [p == "1" for p in parts[-3:]]
+            except Exception:
+                # Fall back to per-channel queries
+                output_states = []
+                for channel in [1, 2, 3]:
+                    instrument.write(_NSEL[channel])
+                    output_str = instrument.query("OUTP?")
+                    output_states.append(int(output_str.strip()) == 1)
 
         # If any channel is on, consider the master state as ON
         device_status["output_state"] = any(output_states)
@@ -117,51 +210,70 @@ def check_initial_output_state():
         device_status["output_state"] = False
 
 
-def monitor_voltage():
-    """Background thread to monitor voltage readings"""
-    global monitoring_active, instrument, voltage_data, time_data, device_status
+def _read_all_voltages():
+    """Read all three channels in one chained VISA transaction"""
+    with visa_lock:
+        resp = instrument.query(_ALL_MEAS)
+    parts = resp.split(";")
+    if len(parts) < 3:
+        raise ValueError(f"short MEAS:VOLT? response: {resp!r}")
+    return [float(p) for p in parts[-3:]]
+
+
+# Each connected /ws/voltage client gets its own bounded queue of samples;
+# slow consumers drop readings instead of growing memory
+_ws_subscribers = set()
 
-    while monitoring_active:
+
+def _publish_sample(channel, t_ns, voltage):
+    for queue in _ws_subscribers:
         try:
-            if instrument and device_status["connected"]:
-                current_channel = device_status["current_channel"]
+            queue.put_nowait((channel, t_ns // 1_000_000, voltage))
+        except asyncio.QueueFull:
+            pass
 
-                # Select current channel and read voltage
-                instrument.write(f"INST:NSEL {current_channel}")
-                voltage_str = instrument.query("MEAS:VOLT?")
-                voltage = float(voltage_str.strip())
 
-                # Store data
-                current_time = datetime.now()
-                voltage_data[current_channel].append(voltage)
-                time_data[current_channel].append(current_time)
+def _append_sample(channel, voltage, t_ns):
+    """Store a reading; old samples age out of the ring automatically"""
+    rings[channel].append(t_ns, voltage)
+    _publish_sample(channel, t_ns, voltage)
 
-                # Clean old data (keep only last 5 minutes)
-                cutoff_time = current_time - timedelta(minutes=5)
-                while (time_data[current_channel] and
-                       time_data[current_channel][0] < cutoff_time):
-                    time_data[current_channel].popleft()
-                    voltage_data[current_channel].popleft()
 
+async def _monitor_loop():
+    """Poll the selected channel once a second as an event-loop task"""
+    global instrument, device_status
+
+    while not _stop_event.is_set():
+        try:
+            if instrument and device_status["connected"]:
+                # One bus round-trip fills all three channel histories, so
+                # switching channels in the UI never starts from an empty plot
+                voltages = await asyncio.to_thread(_read_all_voltages)
+                t_ns = time.time_ns()
+                for channel, voltage in zip((1, 2, 3), voltages):
+                    _append_sample(channel, voltage, t_ns)
         except Exception as e:
             print(f"Monitoring error: {e}")
 
-        time.sleep(1)  # Read every second
+        # Read every second, but wake instantly when asked to stop
+        try:
+            await asyncio.wait_for(_stop_event.wait(), timeout=1.0)
+        except asyncio.TimeoutError:
+            pass
 
 
 def start_monitoring():
-    """Start voltage monitoring thread"""
-    global monitoring_active, monitoring_thread
-    if not monitoring_active:
-        monitoring_active = True
-        monitoring_thread = threading.Thread(target=monitor_voltage, daemon=True)
-        monitoring_thread.start()
+    """Start the voltage monitor task"""
+    global monitor_task, _stop_event
+    if monitor_task is None or monitor_task.done():
+        _stop_event = asyncio.Event()
+        monitor_task = asyncio.create_task(_monitor_loop())
 
 
 def stop_monitoring():
-    """Stop voltage monitoring thread"""
-    global monitoring_active
-    monitoring_active = False
+    """Ask the voltage monitor task to finish; it wakes immediately"""
+    if _stop_event is not None:
+        _stop_event.set()
 
 
 @app.on_event("startup")
@@ -175,12 +287,13 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     stop_monitoring()
+    if monitor_task:
+        await monitor_task
 
 
-@app.get("/", response_class=HTMLResponse)
-async def get_web_interface():
-    """Serve the web interface"""
-    return """
+# The web interface is constant, so encode it once at import time instead
+# of materializing the multi-KB string on every GET /
+_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -274,7 +387,7 @@ async def get_web_interface():
         <script>
             let currentDevice = null;
             let currentChannel = 1;
-            let plotUpdateInterval = null;
+            let voltageSocket = null;
 
             async function apiCall(endpoint, method = 'GET', data = null) {
                 const options = {
@@ -302,9 +415,9 @@ async def get_web_interface():
                 document.getElementById(`ch${channel}-btn`).classList.add('active');
                 document.getElementById('currentChannelInfo').textContent = `Configuring Channel: ${channel}`;
 
-                // Update server
+                // Update server, then redraw the full window for the new channel
                 if (currentDevice) {
-                    apiCall('/api/set-channel', 'POST', { channel: channel });
+                    apiCall('/api/set-channel', 'POST', { channel: channel }).then(updatePlot);
                 }
             }
 
@@ -412,48 +525,51 @@ async def get_web_interface():
                 try {
                     const plotData = await apiCall('/api/plot-data');
 
-                    if (plotData.time.length > 0) {
-                        const trace = {
-                            x: plotData.time,
-                            y: plotData.voltage,
-                            type: 'scatter',
-                            mode: 'lines+markers',
-                            name: `Channel ${currentChannel} Voltage`,
-                            line: { color: '#007bff', width: 2 },
-                            marker: { size: 4 }
-                        };
-
-                        const layout = {
-                            title: `Real-time Voltage - Channel ${currentChannel}`,
-                            xaxis: { 
-                                title: 'Time',
-                                type: 'date'
-                            },
-                            yaxis: { 
-                                title: 'Voltage (V)',
-                                range: [0, 30]
-                            },
-                            margin: { t: 50, r: 50, b: 50, l: 50 },
-                            showlegend: true
-                        };
-
-                        Plotly.newPlot('plotDiv', [trace], layout, {responsive: true});
-                    }
+                    const trace = {
+                        x: plotData.time,
+                        y: plotData.voltage,
+                        type: 'scatter',
+                        mode: 'lines+markers',
+                        name: `Channel ${currentChannel} Voltage`,
+                        line: { color: '#007bff', width: 2 },
+                        marker: { size: 4 }
+                    };
+
+                    const layout = {
+                        title: `Real-time Voltage - Channel ${currentChannel}`,
+                        xaxis: {
+                            title: 'Time',
+                            type: 'date'
+                        },
+                        yaxis: {
+                            title: 'Voltage (V)',
+                            range: [0, 30]
+                        },
+                        margin: { t: 50, r: 50, b: 50, l: 50 },
+                        showlegend: true
+                    };
+
+                    Plotly.newPlot('plotDiv', [trace], layout, {responsive: true});
                 } catch (error) {
                     console.error('Failed to update plot:', error);
                 }
             }
 
             function startPlotUpdates() {
-                if (plotUpdateInterval) clearInterval(plotUpdateInterval);
-                plotUpdateInterval = setInterval(updatePlot, 2000); // Update every 2 seconds
-                updatePlot(); // Initial plot
+                updatePlot(); // Initial full window, then deltas over the socket
+                if (voltageSocket) voltageSocket.close();
+                voltageSocket = new WebSocket(`ws://${location.host}/ws/voltage`);
+                voltageSocket.onmessage = (event) => {
+                    const sample = JSON.parse(event.data);
+                    if (sample.channel !== currentChannel) return;
+                    Plotly.extendTraces('plotDiv', { x: [[sample.t]], y: [[sample.v]] }, [0], 300);
+                };
             }
 
             function clearPlot() {
                 if (currentDevice) {
-                    apiCall('/api/clear-data', 'POST');
-                    Plotly.purge('plotDiv');
+                    // Re-create the empty trace so the socket can extend it
+                    apiCall('/api/clear-data', 'POST').then(updatePlot);
                 }
             }
 
@@ -471,37 +587,61 @@ async def get_web_interface():
     </html>
     """
 
+_HTML_BYTES = _HTML.encode("utf-8")
+
+
+@app.get("/", response_class=HTMLResponse)
+async def get_web_interface():
+    """Serve the web interface"""
+    return Response(
+        content=_HTML_BYTES,
+        media_type="text/html",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
+
 
 # API Routes
+# Short TTL cache for VISA enumeration, which can block for hundreds of ms
+# while the backend probes every bus
+_resources_cache = {"t": 0.0, "v": ()}
+
+
 @app.get("/api/devices")
-async def get_devices():
-    """Get list of available VISA devices"""
+async def get_devices(force: bool = False):
+    """Get list of available VISA devices (pass ?force=1 to rescan)"""
     global rm
     if not rm:
         raise HTTPException(status_code=500, detail="VISA not initialized")
 
+    if not force and time.monotonic() - _resources_cache["t"] < 5.0:
+        return list(_resources_cache["v"])
+
     try:
-        resources = rm.list_resources()
+        resources = await asyncio.to_thread(rm.list_resources)
+        _resources_cache["v"] = tuple(resources)
+        _resources_cache["t"] = time.monotonic()
         return list(resources)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list devices: {str(e)}")
 
 
 @app.post("/api/connect")
-async def connect_device(request: dict):
+async def connect_device(request: ConnectRequest):
     """Connect to a specific device"""
     global rm, instrument, device_status
 
-    device_address = request.get("device_address")
-    if not device_address:
-        raise HTTPException(status_code=400, detail="Device address required")
+    device_address = request.device_address
 
-    try:
-        if instrument:
-            instrument.close()
+    def _open_and_identify():
+        global instrument
+        with visa_lock:
+            if instrument:
+                instrument.close()
+            instrument = rm.open_resource(device_address)
+            return instrument.query("*IDN?").strip()
 
-        instrument = rm.open_resource(device_address)
-        idn = instrument.query("*IDN?").strip()
+    try:
+        idn = await visa_call(_open_and_identify)
 
         device_status.update({
             "connected": True,
@@ -510,7 +650,7 @@ async def connect_device(request: dict):
         })
 
         # Check initial output state
-        check_initial_output_state()
+        await visa_call(check_initial_output_state)
         update_status()
 
         # Start monitoring
@@ -525,18 +665,14 @@ async def connect_device(request: dict):
 
 
 @app.post("/api/set-channel")
-async def set_current_channel(request: dict):
+async def set_current_channel(request: ChannelRequest):
     """Set the current active channel"""
     global device_status
 
-    channel = request.get("channel")
-    if not channel or channel not in [1, 2, 3]:
-        raise HTTPException(status_code=400, detail="Valid channel (1-3) required")
-
-    device_status["current_channel"] = channel
+    device_status["current_channel"] = request.channel
     update_status()
 
-    return {"success": True, "current_channel": channel}
+    return {"success": True, "current_channel": request.channel}
 
 
 @app.post("/api/settings")
@@ -551,16 +687,22 @@ async def apply_settings(settings: PowerSupplySettings):
     if settings.voltage_set > settings.voltage_limit:
         raise HTTPException(status_code=400, detail="Set voltage cannot exceed voltage limit")
 
+    def _apply():
+        with visa_lock:
+            instrument.write(
+                f"INST:NSEL {settings.channel};"
+                f":SOUR:VOLT:LIM {settings.voltage_limit};"
+                f":SOUR:VOLT:LIM:STAT ON;"
+                f":SOUR:VOLT {settings.voltage_set};"
+                f":SOUR:CURR {settings.current}")
+
     try:
-        # Send SCPI commands
-        instrument.write(f"INST:NSEL {settings.channel}")
-        instrument.write(f"SOUR:VOLT:LIM {settings.voltage_limit}")
-        instrument.write("SOUR:VOLT:LIM:STAT ON")
-        instrument.write(f"SOUR:VOLT {settings.voltage_set}")
-        instrument.write(f"SOUR:CURR {settings.current}")
+        # Send SCPI commands off the event loop
+        await visa_call(_apply)
 
-        # Update status
-        device_status["last_settings"] = settings.dict()
+        # Update status; keep the already-validated model instead of
+        # materializing a dict copy per request
+        device_status["last_settings"] = settings
         update_status()
 
         return {"success": True, "message": f"Settings applied to channel {settings.channel}"}
@@ -577,11 +719,15 @@ async def control_output(control: OutputControl):
     if not instrument:
         raise HTTPException(status_code=400, detail="No device connected")
 
+    def _set_all_outputs():
+        # One chained message instead of six round-trips, looked up from
+        # the precomputed table
+        with visa_lock:
+            instrument.write(_ALL_OUTP[control.state])
+
     try:
-        # Set output for ALL channels
-        for channel in [1, 2, 3]:
-            instrument.write(f"INST:NSEL {channel}")
-            instrument.write(f"OUTP {'ON' if control.state else 'OFF'}")
+        # Set output for ALL channels off the event loop
+        await visa_call(_set_all_outputs)
 
         # Update status
         device_status["output_state"] = control.state
@@ -594,40 +740,84 @@ async def control_output(control: OutputControl):
         raise HTTPException(status_code=500, detail=f"Failed to control output: {str(e)}")
 
 
-@app.get("/api/status")
-async def get_status():
+def _status_etag():
+    # The version counter moves in lockstep with every state change, so
+    # it is the ETag — no hashing needed
+    return f'"{device_status["version"]}"'
+
+
+@app.get("/api/status", response_model=None)
+async def get_status(request: Request):
     """Get current device status"""
     global device_status
-    update_status()
-    return device_status
+
+    etag = _status_etag()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    return ORJSONResponse(
+        content=jsonable_encoder(device_status),
+        headers={"ETag": etag}
+    )
 
 
-@app.get("/api/plot-data")
+@app.get("/api/plot-data", response_model=None)
 async def get_plot_data():
     """Get voltage data for plotting"""
-    global voltage_data, time_data, device_status
+    global device_status
 
     current_channel = device_status["current_channel"]
 
-    # Convert deque to lists and format timestamps
-    times = [t.isoformat() for t in time_data[current_channel]]
-    voltages = list(voltage_data[current_channel])
+    # Slice the live 5-minute window out of the ring in one step; ship
+    # timestamps as epoch milliseconds, which Plotly renders as dates
+    cutoff_ns = time.time_ns() - _RETENTION_NS
+    ts, volts = rings[current_channel].window(cutoff_ns)
 
     return {
-        "time": times,
-        "voltage": voltages,
+        "time": (ts // 1_000_000).tolist(),
+        "voltage": volts.tolist(),
         "channel": current_channel
     }
 
 
+@app.websocket("/ws/voltage")
+async def voltage_feed(websocket: WebSocket):
+    """Push each new voltage sample to the client as it is read"""
+    await websocket.accept()
+    queue = asyncio.Queue(maxsize=600)
+    _ws_subscribers.add(queue)
+    try:
+        while True:
+            # Race the next sample against inbound traffic so a closed
+            # socket is noticed right away; waiting only on the queue
+            # would park this task forever while no samples flow
+            sample_task = asyncio.create_task(queue.get())
+            recv_task = asyncio.create_task(websocket.receive())
+            done, pending = await asyncio.wait(
+                {sample_task, recv_task},
+                return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            if recv_task in done:
+                # Clients never send application messages, so anything
+                # other than a disconnect frame is ignored
+                if recv_task.result().get("type") == "websocket.disconnect":
+                    break
+            if sample_task in done:
+                channel, t_ms, voltage = sample_task.result()
+                await websocket.send_json(
+                    {"channel": channel, "t": t_ms, "v": voltage})
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        _ws_subscribers.discard(queue)
+
+
 @app.post("/api/clear-data")
 async def clear_plot_data():
     """Clear all stored voltage data"""
-    global voltage_data, time_data
-
     for ch in [1, 2, 3]:
-        voltage_data[ch].clear()
-        time_data[ch].clear()
+        rings[ch].clear()
 
     return {"success": True, "message": "Plot data cleared"}
 
@@ -637,17 +827,20 @@ async def disconnect_device():
     """Disconnect from current device"""
     global instrument, device_status
 
+    def _shutdown_and_close():
+        global instrument
+        with visa_lock:
+            if instrument:
+                # Turn off all outputs with one chained message
+                instrument.write(_ALL_OUTP[False])
+                instrument.close()
+                instrument = None
+
     try:
         # Stop monitoring
         stop_monitoring()
 
-        if instrument:
-            # Turn off all outputs before disconnecting
-            for ch in [1, 2, 3]:
-                instrument.write(f"INST:NSEL {ch}")
-                instrument.write("OUTP OFF")
-            instrument.close()
-            instrument = None
+        await visa_call(_shutdown_and_close)
 
         device_status.update({
             "connected": False,
@@ -668,9 +861,19 @@ if __name__ == "__main__":
     print("📱 Access the web interface at: http://localhost:8000")
     print("📚 API documentation at: http://localhost:8000/docs")
 
+    # Read-only endpoints would scale across worker processes, but the
+    # instrument handle, ring buffers and WebSocket subscribers all live in
+    # process memory, so running more than one worker requires moving that
+    # state to a shared store first. Default stays 1; opt in via
+    # PSU_SERVER_WORKERS once that is in place.
+    workers = int(os.environ.get("PSU_SERVER_WORKERS", "1"))
+
     uvicorn.run(
-        app,
+        "power_supply_server:app",
         host="0.0.0.0",  # Allow external connections
         port=8000,
+        workers=workers,
+        loop="uvloop",      # libuv event loop, ~10% faster than asyncio's
+        http="httptools",   # C HTTP parser, ~10% faster than h11
         reload=False
     )